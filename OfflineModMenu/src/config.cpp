@@ -4,11 +4,13 @@
 
 #include <algorithm>
 #include <fstream>
+#include <iterator>
 
 using nlohmann::json;
 
-ConfigManager::ConfigManager() {
-    util::ensureDirectories({ std::filesystem::current_path() / "configs" });
+ConfigManager::ConfigManager()
+    : m_configDirectory(std::filesystem::current_path() / "configs") {
+    util::ensureDirectories({ m_configDirectory });
 }
 
 std::optional<ProcessConfig> ConfigManager::load(const std::string& processName) {
@@ -18,28 +20,56 @@ std::optional<ProcessConfig> ConfigManager::load(const std::string& processName)
         return std::nullopt;
     }
 
-    std::ifstream file(path);
+    std::error_code ec;
+    const auto writeTime = std::filesystem::last_write_time(path, ec);
+    const auto size = ec ? 0 : std::filesystem::file_size(path, ec);
+    const bool cacheable = !ec;
+
+    std::lock_guard<std::mutex> lock(m_cacheMutex);
+    if (cacheable) {
+        auto cached = m_cache.find(path.string());
+        if (cached != m_cache.end() && cached->second.writeTime == writeTime && cached->second.size == size) {
+            util::Logger::instance().log(util::Logger::Level::Info, "Loaded cached config for " + processName);
+            return cached->second.config;
+        }
+    }
+
+    std::ifstream file(path, std::ios::binary);
     if (!file.is_open()) {
         util::Logger::instance().log(util::Logger::Level::Error, "Failed to open config for " + processName);
         return std::nullopt;
     }
 
-    json j;
-    file >> j;
+    std::string contents;
+    if (cacheable) {
+        contents.resize(static_cast<size_t>(size));
+        file.read(contents.data(), static_cast<std::streamsize>(contents.size()));
+        contents.resize(static_cast<size_t>(file.gcount()));
+    } else {
+        contents.assign(std::istreambuf_iterator<char>(file), std::istreambuf_iterator<char>());
+    }
+
+    json j = json::parse(contents);
 
     ProcessConfig config;
-    if (j.contains("addresses")) {
-        for (auto& [key, value] : j["addresses"].items()) {
+    if (const auto addresses = j.find("addresses"); addresses != j.end()) {
+        config.addresses.reserve(addresses->size());
+        for (auto& [key, value] : addresses->items()) {
             config.addresses[key] = value.get<uintptr_t>();
         }
     }
 
-    if (j.contains("mods")) {
-        for (auto& [key, value] : j["mods"].items()) {
+    if (const auto mods = j.find("mods"); mods != j.end()) {
+        config.mods.reserve(mods->size());
+        for (auto& [key, value] : mods->items()) {
             config.mods[key] = ModState{ value.value("enabled", false) };
         }
     }
 
+    if (cacheable) {
+        m_cache[path.string()] = CachedConfig{ writeTime, size, config, {} };
+    }
+
     util::Logger::instance().log(util::Logger::Level::Info, "Loaded config for " + processName);
     return config;
 }
@@ -54,20 +84,48 @@ void ConfigManager::save(const std::string& processName, const ProcessConfig& co
         j["mods"][name]["enabled"] = state.enabled;
     }
 
+    const std::string contents = j.dump(4);
+
     const auto path = resolvePath(processName);
-    std::ofstream file(path);
-    if (!file.is_open()) {
-        util::Logger::instance().log(util::Logger::Level::Error, "Unable to save config for " + processName);
-        return;
+    std::lock_guard<std::mutex> lock(m_cacheMutex);
+
+    auto cached = m_cache.find(path.string());
+    if (cached != m_cache.end() && !cached->second.serialized.empty() && cached->second.serialized == contents) {
+        std::error_code ec;
+        const auto writeTime = std::filesystem::last_write_time(path, ec);
+        const auto size = ec ? 0 : std::filesystem::file_size(path, ec);
+        if (!ec && cached->second.writeTime == writeTime && cached->second.size == size) {
+            util::Logger::instance().log(util::Logger::Level::Info, "Config for " + processName + " unchanged, skipped write");
+            return;
+        }
+    }
+    if (cached != m_cache.end()) {
+        m_cache.erase(cached);
+    }
+
+    {
+        std::ofstream file(path);
+        if (!file.is_open()) {
+            util::Logger::instance().log(util::Logger::Level::Error, "Unable to save config for " + processName);
+            return;
+        }
+
+        file.write(contents.data(), static_cast<std::streamsize>(contents.size()));
+    }
+
+    std::error_code ec;
+    const auto writeTime = std::filesystem::last_write_time(path, ec);
+    const auto size = ec ? 0 : std::filesystem::file_size(path, ec);
+    if (!ec) {
+        m_cache[path.string()] = CachedConfig{ writeTime, size, config, contents };
     }
 
-    file << std::setw(4) << j;
     util::Logger::instance().log(util::Logger::Level::Info, "Saved config for " + processName);
 }
 
 std::filesystem::path ConfigManager::resolvePath(const std::string& processName) const {
     auto sanitized = processName;
     std::replace_if(sanitized.begin(), sanitized.end(), [](char c) { return c == ' ' || c == ':'; }, '_');
-    return std::filesystem::current_path() / "configs" / (sanitized + ".json");
+    return m_configDirectory / (sanitized + ".json");
 }
 
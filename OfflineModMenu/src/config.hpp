@@ -4,10 +4,12 @@
 
 #include <nlohmann/json.hpp>
 
+#include <cstdint>
 #include <optional>
 #include <string>
 #include <unordered_map>
 #include <filesystem>
+#include <mutex>
 
 struct ModState {
     bool enabled = false;
@@ -29,6 +31,19 @@ public:
     void save(const std::string& processName, const ProcessConfig& config);
 
 private:
+    //! Parsed config together with the file state it was read from.
+    struct CachedConfig {
+        std::filesystem::file_time_type writeTime;
+        std::uintmax_t size = 0;
+        ProcessConfig config;
+        //! Text last written by save(); empty for entries populated by load().
+        std::string serialized;
+    };
+
     std::filesystem::path resolvePath(const std::string& processName) const;
+
+    std::filesystem::path m_configDirectory;
+    std::unordered_map<std::string, CachedConfig> m_cache;
+    std::mutex m_cacheMutex;
 };
 
@@ -8,13 +8,41 @@
 #include <backends/imgui_impl_dx11.h>
 
 #include <algorithm>
+#include <iterator>
+
+namespace {
+constexpr ImVec4 kAccentColor(0.231f, 0.510f, 0.965f, 1.0f);
+constexpr ImVec4 kWarningColor(0.9f, 0.3f, 0.3f, 1.0f);
+constexpr ImVec2 kMainWindowSize(900, 600);
+constexpr ImVec2 kProcessListSize(0, 300);
+constexpr ImVec2 kProgressBarSize(200, 0);
+constexpr ImGuiSelectableFlags kProcessRowFlags = ImGuiSelectableFlags_AllowDoubleClick;
+constexpr size_t kMaxLogLines = util::Logger::MAX_ENTRIES;
+}
 
 GUIManager::GUIManager() {
+    // Also called from the freeze thread; lines are queued for drainPendingLog.
     util::Logger::instance().setRealtimeCallback([this](const std::string& line) {
-        m_logBuffer.push_back(line);
+        std::lock_guard<std::mutex> lock(m_pendingLogMutex);
+        m_pendingLog.push_back(line);
+        // Nothing drains the queue while the window is hidden; drop the oldest
+        // lines in bulk so it stays bounded without a shift on every line.
+        if (m_pendingLog.size() >= 2 * kMaxLogLines) {
+            m_pendingLog.erase(m_pendingLog.begin(), m_pendingLog.begin() + static_cast<std::ptrdiff_t>(kMaxLogLines));
+        }
+        if (!m_logPending.exchange(true)) {
+            if (HWND hwnd = m_wakeWindow.load()) {
+                PostMessage(hwnd, WM_NULL, 0, 0);
+            }
+        }
     });
 }
 
+GUIManager::~GUIManager() {
+    // The freeze thread may still log while the GUI is torn down.
+    util::Logger::instance().setRealtimeCallback(nullptr);
+}
+
 void GUIManager::initialize(HWND hwnd, ID3D11Device* device, ID3D11DeviceContext* context) {
     if (m_initialized) {
         return;
@@ -28,12 +56,13 @@ void GUIManager::initialize(HWND hwnd, ID3D11Device* device, ID3D11DeviceContext
     ImGui::StyleColorsDark();
     ImGuiStyle& style = ImGui::GetStyle();
     style.FrameRounding = 6.0f;
-    style.Colors[ImGuiCol_TitleBgActive] = ImVec4(0.231f, 0.510f, 0.965f, 1.0f);
-    style.Colors[ImGuiCol_CheckMark] = ImVec4(0.231f, 0.510f, 0.965f, 1.0f);
+    style.Colors[ImGuiCol_TitleBgActive] = kAccentColor;
+    style.Colors[ImGuiCol_CheckMark] = kAccentColor;
 
     ImGui_ImplWin32_Init(hwnd);
     ImGui_ImplDX11_Init(device, context);
 
+    m_wakeWindow = hwnd;
     m_initialized = true;
 }
 
@@ -41,6 +70,7 @@ void GUIManager::shutdown() {
     if (!m_initialized) {
         return;
     }
+    m_wakeWindow = nullptr;
     ImGui_ImplDX11_Shutdown();
     ImGui_ImplWin32_Shutdown();
     ImGui::DestroyContext();
@@ -59,9 +89,10 @@ void GUIManager::render(ProcessManager& processManager,
     ImGui_ImplWin32_NewFrame();
     ImGui::NewFrame();
 
+    drainPendingLog();
     showDisclaimerModal();
 
-    ImGui::SetNextWindowSize(ImVec2(900, 600), ImGuiCond_FirstUseEver);
+    ImGui::SetNextWindowSize(kMainWindowSize, ImGuiCond_FirstUseEver);
     ImGui::Begin("Offline Mod Menu — VonDutch Edition", nullptr, ImGuiWindowFlags_MenuBar);
 
     if (ImGui::BeginTabBar("MainTabs")) {
@@ -74,7 +105,7 @@ void GUIManager::render(ProcessManager& processManager,
             ImGui::EndTabItem();
         }
         if (ImGui::BeginTabItem("Process")) {
-            drawProcessTab(processManager);
+            drawProcessTab(processManager, modManager);
             ImGui::EndTabItem();
         }
         if (ImGui::BeginTabItem("Log")) {
@@ -102,7 +133,7 @@ void GUIManager::drawHomeTab() {
     ImGui::TextWrapped("Welcome to the Offline Mod Menu — VonDutch Edition. This toolkit keeps your singleplayer experiences fresh while staying fully offline. Use the Process tab to attach to your game, then explore the Mods tab to enable features like God Mode or Infinity Ammo.");
     ImGui::Spacing();
     ImGui::Separator();
-    ImGui::Text("Scan Guidance");
+    ImGui::TextUnformatted("Scan Guidance");
     ImGui::BulletText("Shoot once when prompted to capture ammo changes.");
     ImGui::BulletText("Take controlled damage to capture health values.");
     ImGui::BulletText("Use the Next Scan button after each action to narrow results.");
@@ -110,7 +141,7 @@ void GUIManager::drawHomeTab() {
 }
 
 void GUIManager::drawModsTab(ModManager& modManager) {
-    ImGui::Text("Core Mods");
+    ImGui::TextUnformatted("Core Mods");
     for (auto& mod : modManager.mods()) {
         if (!mod) {
             continue;
@@ -126,7 +157,7 @@ void GUIManager::drawModsTab(ModManager& modManager) {
     ImGui::TextDisabled("Community mods can be dropped into the /mods folder and will appear here automatically.");
 }
 
-void GUIManager::drawProcessTab(ProcessManager& processManager) {
+void GUIManager::drawProcessTab(ProcessManager& processManager, ModManager& modManager) {
     static std::vector<ProcessInfo> cachedProcesses;
     if (ImGui::Button("Refresh Processes")) {
         cachedProcesses = processManager.enumerate();
@@ -134,52 +165,80 @@ void GUIManager::drawProcessTab(ProcessManager& processManager) {
 
     ImGui::SameLine();
     if (ImGui::Button("Detach")) {
+        // Mods must release their freezes while the handle is still open.
+        if (processManager.isAttached()) {
+            modManager.detachAll();
+        }
         processManager.detach();
     }
 
     ImGui::Separator();
-    ImGui::BeginChild("ProcessList", ImVec2(0, 300), true);
-    for (const auto& proc : cachedProcesses) {
-        ImGui::PushID(static_cast<int>(proc.pid));
-        ImGuiSelectableFlags flags = ImGuiSelectableFlags_AllowDoubleClick;
-        if (proc.blocked) {
-            ImGui::PushStyleColor(ImGuiCol_Text, ImVec4(0.9f, 0.3f, 0.3f, 1.0f));
-        }
-        if (ImGui::Selectable(proc.name.c_str(), false, flags)) {
+    ImGui::BeginChild("ProcessList", kProcessListSize, true);
+    ImGuiListClipper clipper;
+    clipper.Begin(static_cast<int>(cachedProcesses.size()));
+    while (clipper.Step()) {
+        for (int row = clipper.DisplayStart; row < clipper.DisplayEnd; ++row) {
+            const auto& proc = cachedProcesses[static_cast<size_t>(row)];
+            ImGui::PushID(static_cast<int>(proc.pid));
             if (proc.blocked) {
-                util::Logger::instance().log(util::Logger::Level::Warning, "Blocked process selection: " + proc.name);
-            } else {
-                if (!m_confirmOwnership) {
-                    util::Logger::instance().log(util::Logger::Level::Warning, "Ownership confirmation required before attaching");
-                } else if (!processManager.attach(proc.pid)) {
-                    util::Logger::instance().log(util::Logger::Level::Error, "Failed to attach to process");
+                ImGui::PushStyleColor(ImGuiCol_Text, kWarningColor);
+            }
+            if (ImGui::Selectable(proc.name.c_str(), false, kProcessRowFlags)) {
+                if (proc.blocked) {
+                    util::Logger::instance().log(util::Logger::Level::Warning, "Blocked process selection: " + proc.name);
+                } else {
+                    if (!m_confirmOwnership) {
+                        util::Logger::instance().log(util::Logger::Level::Warning, "Ownership confirmation required before attaching");
+                    } else {
+                        // A new handle may reuse the old value; force the label to rebuild.
+                        m_labelProcess = nullptr;
+                        if (processManager.isAttached()) {
+                            modManager.detachAll();
+                        }
+                        if (processManager.attach(proc.pid)) {
+                            modManager.attachAll(processManager.handle(), *processManager.currentProcessName());
+                        } else {
+                            util::Logger::instance().log(util::Logger::Level::Error, "Failed to attach to process");
+                        }
+                    }
                 }
             }
+            if (proc.blocked) {
+                ImGui::PopStyleColor();
+            }
+            ImGui::PopID();
         }
-        if (proc.blocked) {
-            ImGui::PopStyleColor();
-        }
-        ImGui::PopID();
     }
+    clipper.End();
     ImGui::EndChild();
 
     if (processManager.isAttached()) {
-        ImGui::Text("Attached to: %s", processManager.currentProcessName()->c_str());
+        if (m_labelProcess != processManager.handle()) {
+            m_labelProcess = processManager.handle();
+            m_attachedLabel = "Attached to: " + processManager.currentProcessName().value_or("");
+        }
+        ImGui::TextUnformatted(m_attachedLabel.data(), m_attachedLabel.data() + m_attachedLabel.size());
     } else {
-        ImGui::Text("Mock mode active — no process attached.");
+        m_labelProcess = nullptr;
+        ImGui::TextUnformatted("Mock mode active — no process attached.");
     }
 }
 
 void GUIManager::drawLogTab() {
     ImGui::BeginChild("LogPane", ImVec2(0, 0), true, ImGuiWindowFlags_HorizontalScrollbar);
-    ImGui::PushFont(ImGui::GetIO().Fonts->Fonts[0]);
-    for (const auto& line : m_logBuffer) {
-        ImGui::TextUnformatted(line.c_str());
+    ImGuiListClipper clipper;
+    clipper.Begin(static_cast<int>(m_logBuffer.size()));
+    while (clipper.Step()) {
+        for (int row = clipper.DisplayStart; row < clipper.DisplayEnd; ++row) {
+            const auto& line = m_logBuffer[static_cast<size_t>(row)];
+            ImGui::TextUnformatted(line.data(), line.data() + line.size());
+        }
     }
-    if (ImGui::GetScrollY() >= ImGui::GetScrollMaxY()) {
+    clipper.End();
+    if (m_logAppended && ImGui::GetScrollY() >= ImGui::GetScrollMaxY()) {
         ImGui::SetScrollHereY(1.0f);
     }
-    ImGui::PopFont();
+    m_logAppended = false;
     ImGui::EndChild();
 }
 
@@ -189,13 +248,13 @@ void GUIManager::drawSettingsTab(ConfigManager& configManager, ProcessManager& p
         return;
     }
 
-    const std::string processName = *processManager.currentProcessName();
-
     if (ImGui::Button("Load Config")) {
+        const std::string processName = *processManager.currentProcessName();
         if (auto config = configManager.load(processName)) {
             for (auto& mod : modManager.mods()) {
                 if (mod) {
-                    mod->setEnabled(config->mods[mod->getName()].enabled);
+                    const auto state = config->mods.find(mod->getName());
+                    mod->setEnabled(state != config->mods.end() && state->second.enabled);
                 }
             }
             util::Logger::instance().log(util::Logger::Level::Info, "Config loaded for " + processName);
@@ -204,7 +263,9 @@ void GUIManager::drawSettingsTab(ConfigManager& configManager, ProcessManager& p
 
     ImGui::SameLine();
     if (ImGui::Button("Save Config")) {
+        const std::string processName = *processManager.currentProcessName();
         ProcessConfig cfg;
+        cfg.mods.reserve(modManager.mods().size());
         for (auto& mod : modManager.mods()) {
             if (mod) {
                 cfg.mods[mod->getName()] = ModState{ mod->isEnabled() };
@@ -216,30 +277,59 @@ void GUIManager::drawSettingsTab(ConfigManager& configManager, ProcessManager& p
     ImGui::Separator();
     ImGui::Checkbox("I confirm YES I OWN THIS COPY", &m_confirmOwnership);
     if (!m_confirmOwnership) {
-        ImGui::TextColored(ImVec4(0.9f, 0.3f, 0.3f, 1.0f), "Ownership confirmation required before modifying memory.");
+        ImGui::TextColored(kWarningColor, "Ownership confirmation required before modifying memory.");
     }
 }
 
 void GUIManager::drawStatusBar() {
     ImGui::Separator();
     ImGui::Text("Status: %s", m_statusText.c_str());
-    ImGui::SameLine();
     if (m_isScanning) {
-        ImGui::ProgressBar(m_scanProgress, ImVec2(200, 0), "Scanning");
-    } else {
-        ImGui::Text("\t");
+        ImGui::SameLine();
+        ImGui::ProgressBar(m_scanProgress, kProgressBarSize, "Scanning");
+    }
+}
+
+void GUIManager::drainPendingLog() {
+    // Most frames have nothing queued; check the flag before touching the mutex.
+    if (!m_logPending.exchange(false)) {
+        return;
+    }
+
+    // Swap the batch out so logging threads are only blocked for the swap,
+    // not for the deque insert and trim below. Both vectors keep their capacity.
+    {
+        std::lock_guard<std::mutex> lock(m_pendingLogMutex);
+        m_drainedLog.swap(m_pendingLog);
+    }
+    if (m_drainedLog.empty()) {
+        return;
+    }
+
+    auto first = m_drainedLog.begin();
+    if (m_drainedLog.size() > kMaxLogLines) {
+        first += static_cast<std::ptrdiff_t>(m_drainedLog.size() - kMaxLogLines);
+    }
+    m_logAppended = true;
+    m_logBuffer.insert(m_logBuffer.end(), std::make_move_iterator(first), std::make_move_iterator(m_drainedLog.end()));
+    m_drainedLog.clear();
+
+    if (m_logBuffer.size() > kMaxLogLines) {
+        m_logBuffer.erase(m_logBuffer.begin(), m_logBuffer.begin() + static_cast<std::ptrdiff_t>(m_logBuffer.size() - kMaxLogLines));
     }
 }
 
 void GUIManager::showDisclaimerModal() {
-    if (!m_disclaimerAccepted) {
-        ImGui::OpenPopup("DisclaimerPopup");
+    if (m_disclaimerAccepted) {
+        return;
     }
 
+    ImGui::OpenPopup("DisclaimerPopup");
+
     if (ImGui::BeginPopupModal("DisclaimerPopup", nullptr, ImGuiWindowFlags_AlwaysAutoResize)) {
         ImGui::TextWrapped("This tool is for offline, singleplayer titles you own. Never use it in multiplayer.");
         ImGui::Spacing();
-        ImGui::Text("Type YES to proceed:");
+        ImGui::TextUnformatted("Type YES to proceed:");
         static char buffer[8] = {};
         ImGui::InputText("", buffer, sizeof(buffer));
         if (ImGui::Button("Confirm")) {
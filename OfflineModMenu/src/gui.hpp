@@ -8,13 +8,17 @@
 #include <d3d11.h>
 #include <wrl/client.h>
 
+#include <atomic>
+#include <deque>
 #include <functional>
+#include <mutex>
 #include <string>
 #include <vector>
 
 class GUIManager {
 public:
     GUIManager();
+    ~GUIManager();
 
     void initialize(HWND hwnd, ID3D11Device* device, ID3D11DeviceContext* context);
     void shutdown();
@@ -29,13 +33,16 @@ public:
 private:
     void drawHomeTab();
     void drawModsTab(ModManager& modManager);
-    void drawProcessTab(ProcessManager& processManager);
+    void drawProcessTab(ProcessManager& processManager, ModManager& modManager);
     void drawLogTab();
     void drawSettingsTab(ConfigManager& configManager, ProcessManager& processManager, ModManager& modManager);
     void drawStatusBar();
 
     void showDisclaimerModal();
 
+    //! Moves log lines queued by other threads into the displayed buffer.
+    void drainPendingLog();
+
     bool m_initialized = false;
     bool m_shouldClose = false;
     bool m_disclaimerAccepted = false;
@@ -45,6 +52,16 @@ private:
     float m_scanProgress = 0.0f;
     bool m_isScanning = false;
 
-    std::vector<std::string> m_logBuffer;
+    HANDLE m_labelProcess = nullptr;
+    std::string m_attachedLabel;
+
+    std::deque<std::string> m_logBuffer;
+    bool m_logAppended = false;
+    std::vector<std::string> m_pendingLog;
+    std::vector<std::string> m_drainedLog;
+    std::mutex m_pendingLogMutex;
+    std::atomic<bool> m_logPending{false};
+    //! Window poked when a log batch starts, so an idle main loop wakes up for it.
+    std::atomic<HWND> m_wakeWindow{nullptr};
 };
 
@@ -23,6 +23,15 @@ static Microsoft::WRL::ComPtr<IDXGISwapChain>         g_pSwapChain = nullptr;
 static Microsoft::WRL::ComPtr<ID3D11RenderTargetView> g_mainRenderTargetView = nullptr;
 static WNDCLASSEX                                     g_wcex = {};
 static HWND                                           g_hwnd = nullptr;
+static UINT                                           g_resizeWidth = 0;
+static UINT                                           g_resizeHeight = 0;
+static bool                                           g_swapChainOccluded = false;
+
+// Longest an unfocused window waits for input before drawing another frame.
+static constexpr DWORD kBackgroundFrameWaitMs = 100;
+// Longest a minimized or occluded window waits between mod ticks.
+static constexpr DWORD kHiddenFrameWaitMs = 50;
+static constexpr float kClearColor[4] = { 0.05f, 0.05f, 0.07f, 1.0f };
 
 LRESULT CALLBACK WndProc(HWND hWnd, UINT msg, WPARAM wParam, LPARAM lParam);
 
@@ -32,10 +41,11 @@ void CreateRenderTarget();
 void CleanupRenderTarget();
 
 int APIENTRY WinMain(HINSTANCE hInstance, HINSTANCE, LPSTR, int) {
+    const auto root = std::filesystem::current_path();
     util::ensureDirectories({
-        std::filesystem::current_path() / "configs",
-        std::filesystem::current_path() / "mods",
-        std::filesystem::current_path() / "resources"
+        root / "configs",
+        root / "mods",
+        root / "resources"
     });
 
     util::Logger::instance().log(util::Logger::Level::Info, "Offline Mod Menu starting up");
@@ -65,6 +75,8 @@ int APIENTRY WinMain(HINSTANCE hInstance, HINSTANCE, LPSTR, int) {
 
     gui.initialize(g_hwnd, g_pd3dDevice.Get(), g_pd3dDeviceContext.Get());
 
+    HANDLE scannerProcess = nullptr;
+    bool skipBackgroundWait = false;
     MSG msg = {};
     bool done = false;
     while (!done) {
@@ -80,17 +92,42 @@ int APIENTRY WinMain(HINSTANCE hInstance, HINSTANCE, LPSTR, int) {
             break;
         }
 
-        if (processManager.isAttached()) {
-            memoryScanner.setProcess(processManager.handle());
+        if (processManager.handle() != scannerProcess) {
+            scannerProcess = processManager.handle();
+            memoryScanner.setProcess(scannerProcess);
+        }
+
+        // Minimized or occluded: keep mods ticking but skip drawing.
+        if (IsIconic(g_hwnd) ||
+            (g_swapChainOccluded && g_pSwapChain->Present(0, DXGI_PRESENT_TEST) == DXGI_STATUS_OCCLUDED)) {
+            modManager.tick();
+            MsgWaitForMultipleObjects(0, nullptr, FALSE, kHiddenFrameWaitMs, QS_ALLINPUT);
+            continue;
+        }
+        g_swapChainOccluded = false;
+
+        // Visible but unfocused: a message that ends the wait is handled first and
+        // the frame after it is drawn without waiting again.
+        if (!skipBackgroundWait && GetForegroundWindow() != g_hwnd &&
+            MsgWaitForMultipleObjects(0, nullptr, FALSE, kBackgroundFrameWaitMs, QS_ALLINPUT) == WAIT_OBJECT_0) {
+            skipBackgroundWait = true;
+            continue;
+        }
+        skipBackgroundWait = false;
+
+        if (g_resizeWidth != 0 && g_resizeHeight != 0) {
+            CleanupRenderTarget();
+            g_pSwapChain->ResizeBuffers(0, g_resizeWidth, g_resizeHeight, DXGI_FORMAT_UNKNOWN, 0);
+            g_resizeWidth = g_resizeHeight = 0;
+            CreateRenderTarget();
         }
 
-        const float clearColorWithAlpha[4] = { 0.05f, 0.05f, 0.07f, 1.0f };
         g_pd3dDeviceContext->OMSetRenderTargets(1, g_mainRenderTargetView.GetAddressOf(), nullptr);
-        g_pd3dDeviceContext->ClearRenderTargetView(g_mainRenderTargetView.Get(), clearColorWithAlpha);
+        g_pd3dDeviceContext->ClearRenderTargetView(g_mainRenderTargetView.Get(), kClearColor);
 
         gui.render(processManager, memoryScanner, configManager, modManager);
 
-        g_pSwapChain->Present(1, 0);
+        g_swapChainOccluded = g_pSwapChain->Present(1, 0) == DXGI_STATUS_OCCLUDED;
     }
 
     gui.shutdown();
@@ -163,10 +200,9 @@ LRESULT CALLBACK WndProc(HWND hWnd, UINT msg, WPARAM wParam, LPARAM lParam) {
 
     switch (msg) {
     case WM_SIZE:
-        if (wParam != SIZE_MINIMIZED && g_pSwapChain) {
-            CleanupRenderTarget();
-            g_pSwapChain->ResizeBuffers(0, LOWORD(lParam), HIWORD(lParam), DXGI_FORMAT_UNKNOWN, 0);
-            CreateRenderTarget();
+        if (wParam != SIZE_MINIMIZED) {
+            g_resizeWidth = LOWORD(lParam);
+            g_resizeHeight = HIWORD(lParam);
         }
         return 0;
     case WM_DESTROY:
@@ -4,6 +4,12 @@
 
 #include <algorithm>
 #include <chrono>
+#include <cstring>
+
+namespace {
+constexpr auto kFreezeInterval = std::chrono::milliseconds(30);
+constexpr auto kFreezeMaxInterval = std::chrono::milliseconds(60);
+}
 
 MemoryScanner::MemoryScanner(HANDLE process)
     : m_process(process) {
@@ -61,11 +67,18 @@ std::optional<MemorySnapshot> MemoryScanner::takeSnapshot(uintptr_t base, size_t
 std::vector<uintptr_t> MemoryScanner::compareSnapshots(const MemorySnapshot& previous, const MemorySnapshot& current, int expectedDelta) {
     std::vector<uintptr_t> results;
 
-    size_t count = std::min(previous.data.size(), current.data.size());
+    // memcpy avoids unaligned, aliasing-violating loads; unsigned subtraction
+    // keeps a wrapping delta well defined.
+    const size_t count = std::min(previous.data.size(), current.data.size());
+    const uint8_t* prevData = previous.data.data();
+    const uint8_t* currData = current.data.data();
+    const auto delta = static_cast<uint32_t>(expectedDelta);
     for (size_t i = 0; i + sizeof(int) <= count; i += sizeof(int)) {
-        int prevValue = *reinterpret_cast<const int*>(&previous.data[i]);
-        int currValue = *reinterpret_cast<const int*>(&current.data[i]);
-        if (currValue - prevValue == expectedDelta) {
+        uint32_t prevValue = 0;
+        uint32_t currValue = 0;
+        std::memcpy(&prevValue, prevData + i, sizeof(prevValue));
+        std::memcpy(&currValue, currData + i, sizeof(currValue));
+        if (currValue - prevValue == delta) {
             results.push_back(previous.base + static_cast<uintptr_t>(i));
         }
     }
@@ -91,24 +104,48 @@ std::vector<uintptr_t> MemoryScanner::filterCandidates(const std::vector<uintptr
 
 void MemoryScanner::freezeValue(uintptr_t address, const void* buffer, size_t size) {
     std::lock_guard<std::mutex> lock(m_freezeMutex);
-    auto it = std::find_if(m_freezeEntries.begin(), m_freezeEntries.end(), [address](const FreezeEntry& entry) {
-        return entry.address == address;
+
+    auto it = std::lower_bound(m_freezeEntries.begin(), m_freezeEntries.end(), address, [](const FreezeEntry& entry, uintptr_t value) {
+        return entry.address < value;
     });
 
-    if (it == m_freezeEntries.end()) {
+    if (it == m_freezeEntries.end() || it->address != address) {
         FreezeEntry entry;
         entry.address = address;
         entry.value.assign(reinterpret_cast<const uint8_t*>(buffer), reinterpret_cast<const uint8_t*>(buffer) + size);
         entry.active = true;
-        m_freezeEntries.push_back(std::move(entry));
-    } else {
+        m_freezeEntries.insert(it, std::move(entry));
+        m_freezeRunsDirty = true;
+    } else if (!it->active || it->value.size() != size || std::memcmp(it->value.data(), buffer, size) != 0) {
         it->value.assign(reinterpret_cast<const uint8_t*>(buffer), reinterpret_cast<const uint8_t*>(buffer) + size);
         it->active = true;
+        m_freezeRunsDirty = true;
     }
 
-    if (!m_freezeRequested.load()) {
-        m_freezeRequested = true;
+    if (!m_freezeRequested.exchange(true)) {
         m_freezeThread = std::thread(&MemoryScanner::freezeLoop, this);
+    } else if (m_freezeRunsDirty) {
+        m_freezeWake.notify_one();
+    }
+}
+
+void MemoryScanner::unfreezeValue(uintptr_t address) {
+    bool empty = false;
+    {
+        std::lock_guard<std::mutex> lock(m_freezeMutex);
+        auto it = std::lower_bound(m_freezeEntries.begin(), m_freezeEntries.end(), address, [](const FreezeEntry& entry, uintptr_t value) {
+            return entry.address < value;
+        });
+
+        if (it != m_freezeEntries.end() && it->address == address) {
+            m_freezeEntries.erase(it);
+            m_freezeRunsDirty = true;
+        }
+        empty = m_freezeEntries.empty();
+    }
+
+    if (empty) {
+        stopFreezeThread();
     }
 }
 
@@ -116,9 +153,20 @@ void MemoryScanner::clearFreezes() {
     {
         std::lock_guard<std::mutex> lock(m_freezeMutex);
         m_freezeEntries.clear();
+        m_freezeRunsDirty = true;
     }
 
-    m_freezeRequested = false;
+    stopFreezeThread();
+}
+
+void MemoryScanner::stopFreezeThread() {
+    {
+        // Clear the flag under the lock so the loop cannot miss the wakeup
+        // between checking it and starting to wait.
+        std::lock_guard<std::mutex> lock(m_freezeMutex);
+        m_freezeRequested = false;
+    }
+    m_freezeWake.notify_all();
     if (m_freezeThread.joinable()) {
         m_freezeThread.join();
     }
@@ -127,22 +175,83 @@ void MemoryScanner::clearFreezes() {
 void MemoryScanner::freezeLoop() {
     util::Logger::instance().log(util::Logger::Level::Info, "Freeze loop started");
 
+    // Back off while every frozen value is stable; ticks follow a steady deadline.
+    auto interval = kFreezeInterval;
+    auto deadline = std::chrono::steady_clock::now();
     while (m_freezeRequested.load()) {
-        {
-            std::lock_guard<std::mutex> lock(m_freezeMutex);
-            for (auto& entry : m_freezeEntries) {
-                if (!entry.active) {
-                    continue;
-                }
-                if (!write(entry.address, entry.value.data(), entry.value.size())) {
-                    util::Logger::instance().log(util::Logger::Level::Warning, "Failed to maintain frozen value");
-                }
-            }
+        if (applyFreezes()) {
+            interval = kFreezeInterval;
+        } else {
+            interval = std::min(interval * 3 / 2, kFreezeMaxInterval);
         }
 
-        std::this_thread::sleep_for(std::chrono::milliseconds(30));
+        deadline += interval;
+        const auto now = std::chrono::steady_clock::now();
+        if (deadline + interval < now) {
+            deadline = now;
+        }
+
+        std::unique_lock<std::mutex> lock(m_freezeMutex);
+        m_freezeWake.wait_until(lock, deadline, [this] {
+            return !m_freezeRequested.load() || m_freezeRunsDirty;
+        });
+        if (m_freezeRunsDirty) {
+            deadline = std::chrono::steady_clock::now();
+        }
     }
 
     util::Logger::instance().log(util::Logger::Level::Info, "Freeze loop exited");
 }
 
+bool MemoryScanner::applyFreezes() {
+    std::lock_guard<std::mutex> lock(m_freezeMutex);
+    if (m_freezeRunsDirty) {
+        rebuildFreezeRuns();
+    }
+
+    bool drifted = false;
+    for (auto& run : m_freezeRuns) {
+        m_freezeCurrent.resize(run.bytes.size());
+        const bool unchanged = read(run.base, m_freezeCurrent.data(), m_freezeCurrent.size()) && m_freezeCurrent == run.bytes;
+        if (!unchanged) {
+            drifted = true;
+            const bool written = write(run.base, run.bytes.data(), run.bytes.size());
+            if (!written && !run.failing) {
+                util::Logger::instance().log(util::Logger::Level::Warning, "Failed to maintain frozen value");
+            }
+            run.failing = !written;
+        } else {
+            run.failing = false;
+        }
+    }
+    return drifted;
+}
+
+void MemoryScanner::rebuildFreezeRuns() {
+    std::vector<FreezeRun> previous;
+    previous.swap(m_freezeRuns);
+    for (const auto& entry : m_freezeEntries) {
+        if (!entry.active || entry.value.empty()) {
+            continue;
+        }
+        if (!m_freezeRuns.empty() && m_freezeRuns.back().base + m_freezeRuns.back().bytes.size() == entry.address) {
+            auto& bytes = m_freezeRuns.back().bytes;
+            bytes.insert(bytes.end(), entry.value.begin(), entry.value.end());
+        } else {
+            m_freezeRuns.push_back(FreezeRun{ entry.address, entry.value });
+        }
+    }
+
+    // Both lists are ordered by base; a run that kept its base and length keeps
+    // its failure state so the warning is not repeated after every rebuild.
+    auto old = previous.begin();
+    for (auto& run : m_freezeRuns) {
+        while (old != previous.end() && old->base < run.base) {
+            ++old;
+        }
+        if (old != previous.end() && old->base == run.base && old->bytes.size() == run.bytes.size()) {
+            run.failing = old->failing;
+        }
+    }
+    m_freezeRunsDirty = false;
+}
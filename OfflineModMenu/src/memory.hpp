@@ -7,6 +7,7 @@
 #include <atomic>
 #include <thread>
 #include <mutex>
+#include <condition_variable>
 #include <optional>
 
 struct MemorySnapshot {
@@ -46,16 +47,40 @@ public:
     //! Adds a freeze entry that will be maintained in the background.
     void freezeValue(uintptr_t address, const void* buffer, size_t size);
 
+    //! Stops maintaining the value frozen at the given address.
+    void unfreezeValue(uintptr_t address);
+
     //! Stops all freeze operations.
     void clearFreezes();
 
 private:
     void freezeLoop();
 
+    //! Signals the freeze loop to exit and waits for it.
+    void stopFreezeThread();
+
+    //! Writes all active freeze entries, merging adjacent ones into a single write per run.
+    //! Returns true if any value had drifted and needed to be rewritten.
+    bool applyFreezes();
+
+    //! Rebuilds the coalesced write runs from the current freeze entries.
+    void rebuildFreezeRuns();
+
+    //! Contiguous block of frozen bytes written with a single call.
+    struct FreezeRun {
+        uintptr_t base = 0;
+        std::vector<uint8_t> bytes;
+        bool failing = false;
+    };
+
     HANDLE m_process = nullptr;
     std::vector<FreezeEntry> m_freezeEntries;
+    std::vector<FreezeRun> m_freezeRuns;
+    std::vector<uint8_t> m_freezeCurrent;
+    bool m_freezeRunsDirty = true;
     std::thread m_freezeThread;
     std::atomic<bool> m_freezeRequested{false};
     mutable std::mutex m_freezeMutex;
+    std::condition_variable m_freezeWake;
 };
 
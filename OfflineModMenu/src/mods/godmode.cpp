@@ -6,7 +6,8 @@ namespace {
 constexpr int kDesiredHealth = 100;
 }
 
-GodModeMod::GodModeMod() {
+GodModeMod::GodModeMod(MemoryScanner& scanner)
+    : m_scanner(scanner) {
     m_enabled = false;
 }
 
@@ -17,8 +18,12 @@ void GodModeMod::onAttach(HANDLE process) {
 }
 
 void GodModeMod::onDetach() {
-    m_scanner.clearFreezes();
+    if (m_frozenAddress != 0) {
+        m_scanner.unfreezeValue(m_frozenAddress);
+    }
     m_lastAddress = 0;
+    m_frozenAddress = 0;
+    m_waitingLogged = false;
     util::Logger::instance().log(util::Logger::Level::Info, "God Mode detached");
 }
 
@@ -32,12 +37,21 @@ void GodModeMod::onTick() {
     }
 
     if (m_lastAddress != 0) {
-        m_scanner.freezeValue(m_lastAddress, &kDesiredHealth, sizeof(kDesiredHealth));
+        if (m_frozenAddress != m_lastAddress) {
+            if (m_frozenAddress != 0) {
+                m_scanner.unfreezeValue(m_frozenAddress);
+            }
+            m_scanner.freezeValue(m_lastAddress, &kDesiredHealth, sizeof(kDesiredHealth));
+            m_frozenAddress = m_lastAddress;
+        }
         return;
     }
 
     // In a real implementation we would perform heuristic scanning.
     // For the template we simply log guidance for the user.
-    util::Logger::instance().log(util::Logger::Level::Info, "God Mode waiting for manual scan (mock mode)");
+    if (!m_waitingLogged) {
+        util::Logger::instance().log(util::Logger::Level::Info, "God Mode waiting for manual scan (mock mode)");
+        m_waitingLogged = true;
+    }
 }
 
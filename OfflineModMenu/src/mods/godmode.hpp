@@ -7,7 +7,7 @@
 
 class GodModeMod : public BaseMod {
 public:
-    GodModeMod();
+    explicit GodModeMod(MemoryScanner& scanner);
 
     void onAttach(HANDLE process) override;
     void onDetach() override;
@@ -16,7 +16,9 @@ public:
     bool isCompatible(const std::string& processName) override;
 
 private:
-    MemoryScanner m_scanner;
+    MemoryScanner& m_scanner;
     uintptr_t m_lastAddress = 0;
+    uintptr_t m_frozenAddress = 0;
+    bool m_waitingLogged = false;
 };
 
@@ -4,7 +4,8 @@ namespace {
 constexpr int kDefaultAmmo = 999;
 }
 
-InfAmmoMod::InfAmmoMod() {
+InfAmmoMod::InfAmmoMod(MemoryScanner& scanner)
+    : m_scanner(scanner) {
     m_enabled = false;
 }
 
@@ -15,9 +16,14 @@ void InfAmmoMod::onAttach(HANDLE process) {
 }
 
 void InfAmmoMod::onDetach() {
-    m_scanner.clearFreezes();
+    if (m_frozenAddress != 0) {
+        m_scanner.unfreezeValue(m_frozenAddress);
+    }
     m_lastAddress = 0;
+    m_waitingLogged = false;
     m_maxAmmo = 0;
+    m_frozenAddress = 0;
+    m_frozenAmmo = 0;
     util::Logger::instance().log(util::Logger::Level::Info, "Infinity Ammo detached");
 }
 
@@ -33,10 +39,20 @@ void InfAmmoMod::onTick() {
     int desiredAmmo = m_maxAmmo > 0 ? m_maxAmmo : kDefaultAmmo;
 
     if (m_lastAddress != 0) {
-        m_scanner.freezeValue(m_lastAddress, &desiredAmmo, sizeof(desiredAmmo));
+        if (m_frozenAddress != m_lastAddress || m_frozenAmmo != desiredAmmo) {
+            if (m_frozenAddress != 0 && m_frozenAddress != m_lastAddress) {
+                m_scanner.unfreezeValue(m_frozenAddress);
+            }
+            m_scanner.freezeValue(m_lastAddress, &desiredAmmo, sizeof(desiredAmmo));
+            m_frozenAddress = m_lastAddress;
+            m_frozenAmmo = desiredAmmo;
+        }
         return;
     }
 
-    util::Logger::instance().log(util::Logger::Level::Info, "Infinity Ammo waiting for manual scan (mock mode)");
+    if (!m_waitingLogged) {
+        util::Logger::instance().log(util::Logger::Level::Info, "Infinity Ammo waiting for manual scan (mock mode)");
+        m_waitingLogged = true;
+    }
 }
 
@@ -7,7 +7,7 @@
 
 class InfAmmoMod : public BaseMod {
 public:
-    InfAmmoMod();
+    explicit InfAmmoMod(MemoryScanner& scanner);
 
     void onAttach(HANDLE process) override;
     void onDetach() override;
@@ -16,8 +16,11 @@ public:
     bool isCompatible(const std::string& processName) override;
 
 private:
-    MemoryScanner m_scanner;
+    MemoryScanner& m_scanner;
     uintptr_t m_lastAddress = 0;
+    bool m_waitingLogged = false;
     int m_maxAmmo = 0;
+    uintptr_t m_frozenAddress = 0;
+    int m_frozenAmmo = 0;
 };
 
@@ -22,11 +22,12 @@ ModManager::ModManager() {
 }
 
 void ModManager::discoverMods() {
+    m_attached.clear();
     m_mods.clear();
 
     // Built-in mods compiled directly into the application.
-    m_mods.push_back(std::make_shared<GodModeMod>());
-    m_mods.push_back(std::make_shared<InfAmmoMod>());
+    m_mods.push_back(std::make_shared<GodModeMod>(m_scanner));
+    m_mods.push_back(std::make_shared<InfAmmoMod>(m_scanner));
 
     util::ensureDirectories({ m_modDirectory });
 
@@ -42,24 +43,25 @@ void ModManager::discoverMods() {
 }
 
 void ModManager::attachAll(HANDLE process, const std::string& processName) {
+    m_attached.clear();
     for (auto& mod : m_mods) {
         if (mod && mod->isCompatible(processName)) {
             mod->onAttach(process);
+            m_attached.push_back(mod.get());
         }
     }
 }
 
 void ModManager::detachAll() {
-    for (auto& mod : m_mods) {
-        if (mod) {
-            mod->onDetach();
-        }
+    for (auto* mod : m_attached) {
+        mod->onDetach();
     }
+    m_attached.clear();
 }
 
 void ModManager::tick() {
-    for (auto& mod : m_mods) {
-        if (mod && mod->isEnabled()) {
+    for (auto* mod : m_attached) {
+        if (mod->isEnabled()) {
             mod->onTick();
         }
     }
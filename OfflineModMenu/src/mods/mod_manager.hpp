@@ -2,6 +2,8 @@
 
 #include "base_mod.hpp"
 
+#include "../memory.hpp"
+
 #include <windows.h>
 
 #include <filesystem>
@@ -30,6 +32,11 @@ public:
 
 private:
     std::filesystem::path m_modDirectory;
+    // Shared by all built-in mods so a single freeze thread services every frozen
+    // value. Declared before m_mods so it outlives the mods that reference it.
+    MemoryScanner m_scanner;
     std::vector<std::shared_ptr<BaseMod>> m_mods;
+    //! Mods attached by the last attachAll; the only ones tick() visits.
+    std::vector<BaseMod*> m_attached;
 };
 
@@ -3,64 +3,73 @@
 #include "utils.hpp"
 
 #include <psapi.h>
+#include <tlhelp32.h>
 
 #include <algorithm>
 #include <array>
-#include <unordered_set>
+#include <string_view>
+#include <utility>
 
 namespace {
-const std::unordered_set<std::string> kBlockedNames = {
+constexpr std::array<std::string_view, 5> kBlockedNames = {
     "cs2.exe",
     "valorant.exe",
     "fortnite.exe",
     "apex.exe",
     "overwatch.exe"
 };
+
+bool isBlockedLowerName(std::string_view lowered) {
+    return std::find(kBlockedNames.begin(), kBlockedNames.end(), lowered) != kBlockedNames.end();
+}
 }
 
 ProcessManager::ProcessManager() = default;
 
 std::vector<ProcessInfo> ProcessManager::enumerate() {
     std::vector<ProcessInfo> processes;
-    DWORD processIds[1024] = {};
-    DWORD bytesReturned = 0;
 
-    if (!EnumProcesses(processIds, sizeof(processIds), &bytesReturned)) {
+    HANDLE snapshot = CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0);
+    if (snapshot == INVALID_HANDLE_VALUE) {
         util::Logger::instance().log(util::Logger::Level::Error, "Failed to enumerate processes");
         return processes;
     }
 
-    const DWORD processCount = bytesReturned / sizeof(DWORD);
-    processes.reserve(processCount);
+    std::vector<std::pair<std::string, ProcessInfo>> keyed;
 
-    for (DWORD i = 0; i < processCount; ++i) {
-        DWORD pid = processIds[i];
-        if (pid == 0) {
+    PROCESSENTRY32W entry{};
+    entry.dwSize = sizeof(entry);
+    for (BOOL found = Process32FirstW(snapshot, &entry); found; found = Process32NextW(snapshot, &entry)) {
+        if (entry.th32ProcessID == 0) {
             continue;
         }
 
-        HANDLE handle = OpenProcess(PROCESS_QUERY_INFORMATION | PROCESS_VM_READ, FALSE, pid);
+        // Only list processes the user can actually read from.
+        HANDLE handle = OpenProcess(PROCESS_QUERY_INFORMATION | PROCESS_VM_READ, FALSE, entry.th32ProcessID);
         if (!handle) {
             continue;
         }
-
-        std::array<wchar_t, MAX_PATH> nameBuffer{};
-        if (GetModuleBaseNameW(handle, nullptr, nameBuffer.data(), static_cast<DWORD>(nameBuffer.size()))) {
-            std::string utf8Name = util::wideToUtf8(nameBuffer.data());
-            ProcessInfo info;
-            info.pid = pid;
-            info.name = utf8Name;
-            info.blocked = isBlockedProcess(utf8Name);
-            processes.emplace_back(std::move(info));
-        }
-
         CloseHandle(handle);
+
+        ProcessInfo info;
+        info.pid = entry.th32ProcessID;
+        info.name = util::wideToUtf8(entry.szExeFile);
+        std::string lowered = util::toLower(info.name);
+        info.blocked = isBlockedLowerName(lowered);
+        keyed.emplace_back(std::move(lowered), std::move(info));
     }
 
-    std::sort(processes.begin(), processes.end(), [](const ProcessInfo& a, const ProcessInfo& b) {
-        return util::toLower(a.name) < util::toLower(b.name);
+    CloseHandle(snapshot);
+
+    std::sort(keyed.begin(), keyed.end(), [](const auto& a, const auto& b) {
+        return a.first < b.first;
     });
 
+    processes.reserve(keyed.size());
+    for (auto& item : keyed) {
+        processes.push_back(std::move(item.second));
+    }
+
     return processes;
 }
 
@@ -110,7 +119,7 @@ std::optional<std::string> ProcessManager::currentProcessName() const {
 }
 
 bool ProcessManager::isBlockedProcess(const std::string& name) {
-    return kBlockedNames.count(util::toLower(name)) > 0;
+    return isBlockedLowerName(util::toLower(name));
 }
 
 void ProcessManager::reset() {
@@ -5,22 +5,21 @@
 #include <algorithm>
 #include <codecvt>
 #include <fstream>
-#include <iomanip>
-#include <sstream>
+#include <string_view>
 #include <cctype>
 
 namespace util {
 
 namespace {
-constexpr const char* LEVEL_TAGS[] = {"INFO", "WARN", "ERR"};
+constexpr std::string_view LEVEL_TAGS[] = {"INFO", "WARN", "ERR"};
+constexpr char LINE_SUFFIX[] = " | OFFLINE USE ONLY";
+constexpr char LINE_END[] = "\r\n";
 }
 
 void ensureDirectories(const std::vector<std::filesystem::path>& directories) {
     for (const auto& dir : directories) {
         std::error_code ec;
-        if (!std::filesystem::exists(dir, ec)) {
-            std::filesystem::create_directories(dir, ec);
-        }
+        std::filesystem::create_directories(dir, ec);
     }
 }
 
@@ -28,9 +27,10 @@ std::string wideToUtf8(const std::wstring& value) {
     if (value.empty()) {
         return {};
     }
-    int sizeNeeded = WideCharToMultiByte(CP_UTF8, 0, value.c_str(), static_cast<int>(value.size()), nullptr, 0, nullptr, nullptr);
-    std::string result(sizeNeeded, '\0');
-    WideCharToMultiByte(CP_UTF8, 0, value.c_str(), static_cast<int>(value.size()), result.data(), sizeNeeded, nullptr, nullptr);
+    // A UTF-16 code unit never needs more than three UTF-8 bytes.
+    std::string result(value.size() * 3, '\0');
+    const int written = WideCharToMultiByte(CP_UTF8, 0, value.c_str(), static_cast<int>(value.size()), result.data(), static_cast<int>(result.size()), nullptr, nullptr);
+    result.resize(written > 0 ? static_cast<size_t>(written) : 0);
     return result;
 }
 
@@ -38,9 +38,10 @@ std::wstring utf8ToWide(const std::string& value) {
     if (value.empty()) {
         return {};
     }
-    int sizeNeeded = MultiByteToWideChar(CP_UTF8, 0, value.c_str(), static_cast<int>(value.size()), nullptr, 0);
-    std::wstring result(sizeNeeded, L'\0');
-    MultiByteToWideChar(CP_UTF8, 0, value.c_str(), static_cast<int>(value.size()), result.data(), sizeNeeded);
+    // Every UTF-8 byte yields at most one UTF-16 code unit.
+    std::wstring result(value.size(), L'\0');
+    const int written = MultiByteToWideChar(CP_UTF8, 0, value.c_str(), static_cast<int>(value.size()), result.data(), static_cast<int>(result.size()));
+    result.resize(written > 0 ? static_cast<size_t>(written) : 0);
     return result;
 }
 
@@ -53,9 +54,14 @@ std::string toLower(const std::string& value) {
 std::string timeString() {
     SYSTEMTIME st{};
     GetLocalTime(&st);
-    std::ostringstream oss;
-    oss << std::setfill('0') << std::setw(2) << st.wHour << ':' << std::setw(2) << st.wMinute << ':' << std::setw(2) << st.wSecond;
-    return oss.str();
+
+    const WORD parts[] = { st.wHour, st.wMinute, st.wSecond };
+    std::string result = "00:00:00";
+    for (size_t i = 0; i < 3; ++i) {
+        result[i * 3] = static_cast<char>('0' + parts[i] / 10);
+        result[i * 3 + 1] = static_cast<char>('0' + parts[i] % 10);
+    }
+    return result;
 }
 
 Logger& Logger::instance() {
@@ -65,24 +71,39 @@ Logger& Logger::instance() {
 
 Logger::Logger() {
     m_logPath = std::filesystem::current_path() / "log.txt";
+    m_logFile.open(m_logPath, std::ios::app | std::ios::binary);
     appendToFile("==== Offline Mod Menu Log (OFFLINE USE ONLY) ====");
 }
 
 void Logger::log(Level level, const std::string& message) {
-    const std::string line = '[' + timeString() + "] [" + LEVEL_TAGS[static_cast<int>(level)] + "] " + message + " | OFFLINE USE ONLY";
+    const std::string time = timeString();
+    const std::string_view tag = LEVEL_TAGS[static_cast<int>(level)];
+    std::string line;
+    line.reserve(time.size() + tag.size() + message.size() + sizeof(LINE_SUFFIX) + 6);
+    line += '[';
+    line += time;
+    line += "] [";
+    line += tag;
+    line += "] ";
+    line += message;
+    line += LINE_SUFFIX;
 
     std::lock_guard<std::mutex> lock(m_mutex);
-    m_entries.push_back(line);
     appendToFile(line);
 
     if (m_callback) {
         m_callback(line);
     }
+
+    m_entries.push_back(std::move(line));
+    if (m_entries.size() > MAX_ENTRIES) {
+        m_entries.pop_front();
+    }
 }
 
 std::vector<std::string> Logger::fetchEntries() {
     std::lock_guard<std::mutex> lock(m_mutex);
-    return m_entries;
+    return std::vector<std::string>(m_entries.begin(), m_entries.end());
 }
 
 void Logger::setRealtimeCallback(std::function<void(const std::string&)> callback) {
@@ -91,9 +112,11 @@ void Logger::setRealtimeCallback(std::function<void(const std::string&)> callbac
 }
 
 void Logger::appendToFile(const std::string& line) {
-    std::ofstream file(m_logPath, std::ios::app);
-    if (file.is_open()) {
-        file << line << '\n';
+    // Binary stream: each entry is one write, without CRT newline translation.
+    if (m_logFile.is_open()) {
+        m_logFile.write(line.data(), static_cast<std::streamsize>(line.size()));
+        m_logFile.write(LINE_END, sizeof(LINE_END) - 1);
+        m_logFile.flush();
     }
 }
 
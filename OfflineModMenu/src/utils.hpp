@@ -2,8 +2,10 @@
 
 #include <string>
 #include <vector>
+#include <deque>
 #include <mutex>
 #include <filesystem>
+#include <fstream>
 #include <functional>
 
 namespace util {
@@ -32,13 +34,16 @@ public:
         Error
     };
 
+    //! Number of recent entries kept in memory, here and in the GUI log pane.
+    static constexpr size_t MAX_ENTRIES = 5000;
+
     //! Returns the global logger instance.
     static Logger& instance();
 
     //! Appends a log entry to the log file and GUI buffer.
     void log(Level level, const std::string& message);
 
-    //! Retrieves a copy of the internal log buffer.
+    //! Retrieves a copy of the most recent log entries.
     std::vector<std::string> fetchEntries();
 
     //! Allows the GUI to register a callback to receive real-time log entries.
@@ -49,9 +54,10 @@ private:
     void appendToFile(const std::string& line);
 
     std::mutex m_mutex;
-    std::vector<std::string> m_entries;
+    std::deque<std::string> m_entries;
     std::function<void(const std::string&)> m_callback;
     std::filesystem::path m_logPath;
+    std::ofstream m_logFile;
 };
 
 } // namespace util